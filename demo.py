@@ -1,5 +1,7 @@
 import argparse
+from collections import namedtuple
 import csv
+import sys
 import time
 
 
@@ -40,25 +42,13 @@ def parse_args():
     return parser.parse_args()
 
 
-class Demo(object):
+class Demo(namedtuple('Demo', ['title', 'nick', 'min', 'sec', 'version', 'time', 'version_str'])):
+    __slots__ = ()
 
-    def __init__(self, title, nick, min, sec, version=None):
-        self.title = title
-        self.nick = nick
-        self.min = min
-        self.sec = sec
-        self.version = version
-
-    @property
-    def time(self):
-        return '{min}m{sec}s'.format(min=self.min, sec=self.sec)
-
-    @property
-    def version_str(self):
-        if self.version is None:
-            return ''
-        else:
-            return ' ({version})'.format(version=self.version)
+    def __new__(cls, title, nick, min, sec, version=None):
+        time = f'{min}m{sec}s'
+        version_str = '' if version is None else f' ({version})'
+        return super().__new__(cls, title, nick, min, sec, version, time, version_str)
 
 
 def main():
@@ -78,27 +68,26 @@ def parse_data(args):
             if youtube_link is None:
                 youtube_link = row[0]
                 continue
-            min, sec = row[2].split(':')
-            try:
-                demo_kwargs = {'version': row[3]}
-            except IndexError:
-                demo_kwargs = {}
-            demos.append(Demo(row[0], row[1], min, sec, **demo_kwargs))
+            title, nick, timestamp, *rest = row
+            min, sec = timestamp.split(':', 1)
+            version = rest[0] if rest else None
+            demos.append(Demo(title, nick, min, sec, version))
     youtube_slug = youtube_link.split('?v=')[1]
     return (youtube_slug, demos)
 
 
 def display_youtube_description(args, youtube_slug, demos):
-    print("""
+    out = ["""
 
 --------------------   youtube comments   ---------------------
-""")
+\n"""]
     for demo in demos:
-        print('{min}:{sec} {title} ({nick}){version_str}\n'.format(min=demo.min, sec=demo.sec, title=demo.title, nick=demo.nick, version_str=demo.version_str))
+        out.append(f'{demo.min}:{demo.sec} {demo.title} ({demo.nick}){demo.version_str}\n\n')
+    sys.stdout.write(''.join(out))
 
 
 def display_pulp_list_email(args, youtube_slug, demos):
-    print("""
+    out = ["""
 
 --------------------   email   ---------------------
 
@@ -106,21 +95,21 @@ The Pulp Community Demo video is available on the Pulp YouTube Channel [0] and o
 
 
 Sections from the demo:
-""")
+\n"""]
     for demo in demos:
-        print('* {title} ({nick}){version_str} - http://www.youtube.com/watch?v={youtube_slug}&t={time}\n'.format(
-            title=demo.title, nick=demo.nick, youtube_slug=youtube_slug, time=demo.time, version_str=demo.version_str
-        ))
+        out.append(f'* {demo.title} ({demo.nick}){demo.version_str} - '
+                   f'http://www.youtube.com/watch?v={youtube_slug}&t={demo.time}\n\n')
 
-    print("""
+    out.append("""
 You can find the presenter IRC nicknames in the links above along with the version numbers they are being released in. You can ask questions via the mailing list or come chat on IRC.
 
 [0]: https://www.youtube.com/PulpProject
-[1]: """)
+[1]: \n""")
+    sys.stdout.write(''.join(out))
 
 
 def display_blog_post(args, youtube_slug, demos):
-    print("""
+    out = ["""
 
 --------------------   blog   ---------------------
 
@@ -133,11 +122,12 @@ tags:
 The Community Demo is available on the [Pulp YouTube Channel](https://www.youtube.com/PulpProject). See the agenda below.
 
 <iframe width="560" height="315" src="https://www.youtube.com/embed/{youtube_slug}" frameborder="0" allowfullscreen></iframe>
-""".format(youtube_slug=youtube_slug, date=args.date, author=args.author))
+\n""".format(youtube_slug=youtube_slug, date=args.date, author=args.author)]
 
     for demo in demos:
-        print("""[{title} ({nick}){version_str}](http://www.youtube.com/watch?v={youtube_slug}&t={time})
-""".format(title=demo.title, nick=demo.nick, youtube_slug=youtube_slug, time=demo.time, version_str=demo.version_str))
+        out.append(f'[{demo.title} ({demo.nick}){demo.version_str}]'
+                   f'(http://www.youtube.com/watch?v={youtube_slug}&t={demo.time})\n\n')
+    sys.stdout.write(''.join(out))
 
 
 if __name__ == "__main__":
@@ -20,7 +20,9 @@ See the --help for more info on the arguments.
 
 import argparse
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import os
+import sys
 
 from redminelib import Redmine
 
@@ -92,7 +94,7 @@ The `pulp_streamer` and `goferd` services should be omitted if those services ar
 
 
 ## Issues Addressed
-{issue_str}
+{template_issue_str}
 """
 
 
@@ -100,6 +102,8 @@ TWEET_TEMPLATE = "Pulp {full_version}{beta_name_number} is available with {featu
 
 
 REDMINE_URL = 'https://pulp.plan.io'
+REDMINE_PAGE_SIZE = 100
+REDMINE_MAX_WORKERS = 8
 
 
 def x_y_z_version(version):
@@ -138,53 +142,56 @@ def parse_args():
     return args
 
 
+def fetch_issues(redmine, query_num):
+    first_page = redmine.issue.filter(query_id=query_num, offset=0, limit=REDMINE_PAGE_SIZE)
+    issues = list(first_page)
+    total_count = first_page.total_count
+    if total_count <= REDMINE_PAGE_SIZE:
+        return issues
+
+    def fetch_page(offset):
+        return list(redmine.issue.filter(query_id=query_num, offset=offset,
+                                         limit=REDMINE_PAGE_SIZE))
+
+    with ThreadPoolExecutor(max_workers=REDMINE_MAX_WORKERS) as executor:
+        pages = executor.map(fetch_page, range(REDMINE_PAGE_SIZE, total_count, REDMINE_PAGE_SIZE))
+        issues.extend(issue for page in pages for issue in page)
+    return issues
+
+
 def print_announcements(args):
     redmine = Redmine(REDMINE_URL, key=os.environ['REDMINE_KEY'])
-    issues = [issue for issue in redmine.issue.filter(query_id=args.query_num)]
+    issues = fetch_issues(redmine, args.query_num)
     issues_by_project = defaultdict(list)
     for issue in issues:
         issues_by_project[issue.project.name].append(issue)
 
-    issue_str = ''
+    issue_parts = []
+    template_issue_parts = []
     projects = sorted(issues_by_project.keys())
     for project_name in projects:
-        issue_str += '\n' + project_name + '\n'
+        issue_parts.append(f'\n{project_name}\n')
+        template_issue_parts.append(f'\n### {project_name}\n')
         for issue in issues_by_project[project_name]:
-            issue_str += '\t{num}\t{subject}\n'.format(num=issue.id, subject=issue.subject)
+            num, subject, url = issue.id, issue.subject, issue.url
+            issue_parts.append(f'\t{num}\t{subject}\n')
+            template_issue_parts.append(f'- [{num}\t{subject}]({url})\n')
+    issue_str = ''.join(issue_parts)
+    template_issue_str = ''.join(template_issue_parts)
 
-    project_str = ', '.join(projects[:-1]) + ', and {last_one}'.format(last_one=projects[-1])
+    project_str = ', '.join(projects[:-1]) + f', and {projects[-1]}'
     x_y_version = args.version.rpartition('.')[0]
-    email_msg = EMAIL_TEMPLATE.format(issue_str=issue_str, projects=project_str,
-                                      full_version=args.version, x_y_version=x_y_version,
-                                      beta_or_stable=args.beta_or_stable,
-                                      features_or_fixes=args.features_or_fixes,
-                                      beta_name_number=args.beta_name_number)
-    print(email_msg)
-
-    print('---------------------------------------------------\n')
-
-    template_issue_str = ''
-    for project_name in projects:
-        template_issue_str += '\n### ' + project_name + '\n'
-        for issue in issues_by_project[project_name]:
-            template_issue_str += '- [{num}\t{subject}]({url})\n'.format(num=issue.id,
-                                                                          subject=issue.subject,
-                                                                          url=issue.url)
-    blog_msg = BLOG_POST_TEMPLATE.format(issue_str=template_issue_str, projects=project_str,
-                                         full_version=args.version, author=args.author,
-                                         beta_or_stable=args.beta_or_stable,
-                                         features_or_fixes=args.features_or_fixes,
-                                         beta_name_number=args.beta_name_number)
-
-    print(blog_msg)
-
-    print('---------------------------------------------------\n')
-
-    tweet_msg = TWEET_TEMPLATE.format(full_version=args.version, projects=project_str,
-                                      features_or_fixes=args.features_or_fixes,
-                                      upgrade_or_test=args.upgrade_or_test,
-                                      beta_name_number=args.beta_name_number)
-    print(tweet_msg)
+    context = {**vars(args), 'issue_str': issue_str, 'template_issue_str': template_issue_str,
+               'projects': project_str, 'full_version': args.version,
+               'x_y_version': x_y_version}
+
+    separator = '---------------------------------------------------\n'
+    out = [
+        EMAIL_TEMPLATE.format_map(context), separator,
+        BLOG_POST_TEMPLATE.format_map(context), separator,
+        TWEET_TEMPLATE.format_map(context),
+    ]
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 def main():